@@ -1,4 +1,4 @@
-from qgis.core import QgsVectorLayer, QgsProject, QgsRendererCategory, QgsCategorizedSymbolRenderer, QgsSymbol
+from qgis.core import QgsVectorLayer, QgsProject, QgsRendererCategory, QgsCategorizedSymbolRenderer, QgsSymbol, QgsVectorSimplifyMethod
 from PyQt5.QtGui import QColor
 import os
 
@@ -21,27 +21,41 @@ layer = QgsVectorLayer(geojson_relative_path, "Propriétaires", "ogr")
 if not layer.isValid():
     print("Error loading the layer.")
 else:
+    # Simplify the parcel geometries while rendering: vertices closer than
+    # one pixel are dropped, so dense parcels draw far fewer points when
+    # zoomed out
+    simplify_method = layer.simplifyMethod()
+    simplify_method.setSimplifyHints(
+        QgsVectorSimplifyMethod.FullSimplification)
+    simplify_method.setSimplifyAlgorithm(QgsVectorSimplifyMethod.Distance)
+    simplify_method.setThreshold(1.0)
+    simplify_method.setForceLocalOptimization(True)
+    layer.setSimplifyMethod(simplify_method)
+
     # Add the layer to the QGIS project
     QgsProject.instance().addMapLayer(layer)
 
     # Check if the 'Propriétaires' column exists to avoid errors
     if 'Propriétaires' in layer.fields().names():
-        # Collect unique values from the 'Propriétaires' column
-        unique_owners = set()
-        for feature in layer.getFeatures():
-            owner = feature['Propriétaires']
-            if owner:  # Ensure the string is not empty
-                unique_owners.add(owner)
+        # Collect unique values from the 'Propriétaires' column, letting the
+        # provider compute them instead of fetching every feature (and its
+        # geometry) in Python
+        field_index = layer.fields().indexOf('Propriétaires')
+        unique_owners = {
+            owner for owner in layer.uniqueValues(field_index)
+            if owner}  # Ensure the string is not empty (or NULL)
 
         # Create symbol categories for each unique value of 'Propriétaires'
         categories = []
+        geometry_type = layer.geometryType()
+        # Spread the hues evenly over the color wheel; fromHsv expects an
+        # integer hue in [0, 360), which i < owner_count already guarantees
+        owner_count = len(unique_owners)
         for i, owner in enumerate(unique_owners):
-            symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+            symbol = QgsSymbol.defaultSymbol(geometry_type)
             # Dynamically set the symbol color for visual diversity
             symbol.setColor(
-                QColor.fromHsv(
-                    (360 * i / len(unique_owners)) %
-                    360, 255, 255))
+                QColor.fromHsv(360 * i // owner_count, 255, 255))
             category = QgsRendererCategory(owner, symbol, owner)
             categories.append(category)
 
@@ -9,11 +9,14 @@ Imported Libraries:
     - argparse: Facilitates parsing of command-line arguments.
     - os: Provides a way of using operating system dependent functionality.
     - logging: Supports logging of messages with varying levels of severity.
+    - queue, atexit: Hand log records to a background writer thread and stop it on exit.
 
 Features:
     - Sets the current working directory to the project's root directory.
     - Creates a dedicated log directory if it doesn't exist.
-    - Initializes logging to record messages at the INFO level and above.
+    - Initializes logging to record messages at the INFO level and above,
+    writing the log file from a background thread.
+    - read_cached_config: Parses a config file once per modification time and caches its sections.
 
 Class ConfigManager:
     - Initializes by reading the configuration from the config.ini file and parsing command-line arguments.
@@ -26,8 +29,11 @@ Class ConfigManager:
 """
 import configparser
 import argparse
+import atexit
 import os
 import logging
+import logging.handlers
+import queue
 
 # Get the directory where the script is located
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -39,16 +45,68 @@ os.chdir(script_dir)
 # Create the log directory if it does not exist
 log_directory = os.path.join(os.path.dirname(
     os.path.abspath(__file__)), 'outputs')
-if not os.path.exists(log_directory):
-    os.makedirs(log_directory)
+os.makedirs(log_directory, exist_ok=True)
 
-# Initialize logging to record messages with the level of INFO and above
-logging.basicConfig(filename='outputs/project.log',
-                    level=logging.INFO,
-                    format='%(asctime)s:%(levelname)s:%(message)s')
+# Initialize logging to record messages with the level of INFO and above.
+# Records are put on a queue and written to the log file by a background
+# listener thread, so logging calls never wait on disk I/O.
+root_logger = logging.getLogger()
+if not root_logger.handlers:
+    log_file_handler = logging.FileHandler('outputs/project.log')
+    log_file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s:%(levelname)s:%(message)s'))
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    log_listener = logging.handlers.QueueListener(log_queue, log_file_handler)
+    log_listener.start()
+    # Flush the remaining records to the file when the program exits
+    atexit.register(log_listener.stop)
+
+# Parsed configuration files, keyed by (absolute path, modification time).
+# The GUI creates a new ConfigManager on every submit, so each config file is
+# parsed once and later instances only copy the cached values.
+_CONFIG_CACHE = {}
+
+
+def read_cached_config(config_path: str) -> dict:
+    """
+    Returns the sections of a config file as a dict of dicts, parsing the file
+    only if it has not been read before or was modified since.
+
+    Args:
+        config_path (str): Path to the config file.
+
+    Returns:
+        dict: A dictionary mapping section names to their options.
+    """
+    key = (os.path.abspath(config_path), os.path.getmtime(config_path))
+    sections = _CONFIG_CACHE.get(key)
+    if sections is None:
+        parser = configparser.ConfigParser()
+        parser.read(config_path, encoding='utf-8')
+        # Keep the raw, uninterpolated values: read_dict interpolates them
+        # again when they are copied into each ConfigManager
+        sections = {name: dict(parser.items(name, raw=True))
+                    for name in parser.sections()}
+        _CONFIG_CACHE[key] = sections
+    return sections
 
 
 class ConfigManager:
+    # Declare the instance attributes up front so instances carry no __dict__.
+    __slots__ = (
+        'config',
+        'input_csv_path',
+        'input_geojson_path',
+        'output_geojson_path',
+        'inconsistencies_csv_path',
+        'id_csv_column',
+        'prop_name',
+        'individual_prop_name',
+        'csv_separator',
+        'fallback_separator')
+
     def __init__(self):
         # Initialize the parser and the configuration
         self.config = configparser.ConfigParser()
@@ -64,18 +122,29 @@ class ConfigManager:
             logging.error('Config file not found. Exiting.')
             raise FileNotFoundError('Config file not found. Exiting.')
 
-        # Read the config file and log the success
-        self.config.read(config_path, encoding='utf-8')
+        # Read the config file (from the cache when possible) and log the success.
+        # read_dict copies the values, so changes made on this instance never
+        # leak into the cache.
+        self.config.read_dict(read_cached_config(config_path))
         logging.info('Config file read successfully.')
 
     def parse_command_line_args(self):
         """Parses command line arguments and updates the configuration."""
+        # Parse --config first, so the selected file is read exactly once and
+        # the defaults of the remaining arguments come from it.
+        config_parser = argparse.ArgumentParser(add_help=False)
+        config_parser.add_argument(
+            '--config', help='Path to the config file', default='config.ini')
+        config_args, remaining_args = config_parser.parse_known_args()
+        if (config_args.config and os.path.exists(config_args.config)
+                and os.path.abspath(config_args.config) != os.path.abspath('config.ini')):
+            self.config.read_dict(read_cached_config(config_args.config))
+
         # Define the command line arguments that the program accepts
         parser = argparse.ArgumentParser(
-            description='Process CSV and GeoJSON files for property data.')
+            description='Process CSV and GeoJSON files for property data.',
+            parents=[config_parser])
         # Initialize the argument parser with a description.
-        parser.add_argument(
-            '--config', help='Path to the config file', default='config.ini')
         parser.add_argument('--input_csv', help='Path to the input CSV file')
         parser.add_argument('--input_geojson',
                             help='Path to the input GeoJSON file')
@@ -103,13 +172,18 @@ class ConfigManager:
                 'IndividualPropName'))
         parser.add_argument('--csv_separator', help='CSV separator',
                             default=self.config.get('Options', 'CSVSeparator'))
+        parser.add_argument(
+            '--fallback_separator',
+            help='CSV separator to use if --csv_separator does not match the file',
+            default=self.config.get(
+                'Options',
+                'FallbackCSVSeparator',
+                fallback=None))
 
         # Parse the command line arguments
-        args = parser.parse_args()
+        args = parser.parse_args(remaining_args)
 
         # Update the configuration with command line arguments if provided
-        if args.config:
-            self.config.read(args.config)
         if args.input_csv:
             self.config.set('Paths', 'InputCSV', args.input_csv)
         if args.input_geojson:
@@ -129,7 +203,10 @@ class ConfigManager:
                             args.individual_prop_name)
         if args.csv_separator:
             self.config.set('Options', 'CSVSeparator', args.csv_separator)
-            logging.info(f"CSV separator set to: {args.csv_separator}")
+            logging.info("CSV separator set to: %s", args.csv_separator)
+        if args.fallback_separator:
+            self.config.set('Options', 'FallbackCSVSeparator',
+                            args.fallback_separator)
 
         # Log that the command line arguments have been processed
         logging.info('Command line arguments processed.')
@@ -146,6 +223,8 @@ class ConfigManager:
         self.individual_prop_name = self.config.get(
             'Options', 'IndividualPropName')
         self.csv_separator = self.config.get('Options', 'CSVSeparator')
+        self.fallback_separator = self.config.get(
+            'Options', 'FallbackCSVSeparator', fallback=None)
 
     def update_config(
             self,
@@ -191,5 +270,5 @@ if __name__ == '__main__':
         # Here you can add more logic or call other modules as needed.
     except Exception as e:
         # Log any exceptions that occur and print an error message
-        logging.error(f'An error occurred: {e}')
+        logging.error('An error occurred: %s', e)
         print(f'An error occurred: {e}')
@@ -5,10 +5,15 @@ It provides functionalities for formatting a specific ID column to match a prede
 processing a CSV to group owners by parcel ID, and exporting the processed data to a new CSV file.
 
 Functions:
+    - format_id_csv_column_or_none: Formats the ID field like format_id_csv_column,
+    returning None instead of raising on invalid values.
     - format_id_csv_column: Formats the ID field to match the specified ID format, 
     ensuring it aligns with the GeoJSON file requirements.
     - process_csv: Processes the input CSV file by grouping owners by their parcel ID, 
-    handling invalid ID formats, and exporting the grouped data to a new CSV file.
+    handling invalid ID formats, exporting the grouped data to a new CSV file
+    and returning it.
+    - stream_csv: Reads a CSV file exported by export_to_csv and yields its parcel IDs and lists
+    of owners one row at a time.
     - read_csv: Reads a CSV file and returns a dictionary mapping parcel IDs to lists of owners,
     facilitating data manipulation and access.
     - export_to_csv : Exports the processed data, which maps parcel IDs to lists of owners, to a specified CSV file, ensuring data persistence and accessibility.
@@ -16,16 +21,59 @@ Functions:
 Dependencies:
     - csv: For reading from and writing to CSV files.
     - re: For regular expression matching, particularly in formatting ID columns.
+    - sys: For interning the formatted parcel IDs used as dictionary keys.
     - logging: For logging messages, including errors and informational messages.
     - defaultdict from collections: For easily grouping data without initializing keys first.
+    - lru_cache from functools: For memoizing the formatting of repeated parcel IDs.
 
 """
 
 import csv
 import logging
 import re
-from typing import Dict, List
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from collections import defaultdict
+from functools import lru_cache
+
+# Pattern used to extract the insee code, section code, and parcel number
+# from the ID column. Compiled once at import time instead of on every row.
+_ID_PATTERN = re.compile(r'(\d{5})\s*([A-Z]+)\s*(\d+)')
+
+# Name of the column holding the owners of each parcel in the input CSV.
+_OWNERS_COLUMN = 'Nom complet du proprietaire [BG]'
+
+
+@lru_cache(maxsize=None)
+def format_id_csv_column_or_none(id_csv_column: str) -> Optional[str]:
+    """
+    Formats the 'Bg Emplacement' field like format_id_csv_column, but returns
+    None instead of raising when the value does not match the expected format.
+    Used in the per-row loop of process_csv, where no exception is set up for
+    the common, valid case.
+
+    Results are memoized: parcels with several owners span several rows with
+    the same ID value, which is then formatted only once. process_csv clears
+    the cache before reading each file.
+
+    Parameters:
+    id_csv_column (str): The 'Bg Emplacement' field from the CSV file.
+
+    Returns:
+    str or None: The formatted parcel ID, or None if the value is invalid.
+    """
+    # Use a regular expression to extract the insee code, section code, and
+    # parcel number from the 'Id column' field.
+    match = _ID_PATTERN.match(id_csv_column)
+    if match is None:
+        return None
+    insee_code, section_code, parcel_number = match.groups()
+    # Slice the zero padding out of constant strings instead of branching
+    # on the section length and calling zfill: '0000' before a 1-letter
+    # section, '000' before a 2-letter one, and the parcel number padded
+    # to 4 digits with leading zeros.
+    return ''.join((insee_code, '00000'[len(section_code):], section_code,
+                    '0000'[len(parcel_number):], parcel_number))
 
 
 def format_id_csv_column(id_csv_column):
@@ -44,56 +92,68 @@ def format_id_csv_column(id_csv_column):
     Returns:
     str: The formatted parcel ID.
     """
-    # Use a regular expression to extract the insee code, section code, and
-    # parcel number from the 'Id column' field.
-    match = re.match(r'(\d{5})\s*([A-Z]+)\s*(\d+)', id_csv_column)
-    if match:
-        insee_code, section_code, parcel_number = match.groups()
-        # Pad the parcel number with leading zeros to ensure it's 4 digits
-        parcel_number = parcel_number.zfill(4)
-        # Determine the number of zeros based on the length of the section code
-        zeros = '0000' if len(section_code) == 1 else '000'
-        return f"{insee_code}{zeros}{section_code}{parcel_number}"
-    else:
+    formatted_id = format_id_csv_column_or_none(id_csv_column)
+    if formatted_id is None:
         # Log an error if the 'Id CSV column' doesn't match the expected
         # pattern
         logging.error(
-            f"Id column value '{id_csv_column}' does not match the expected format.")
+            "Id column value '%s' does not match the expected format.", id_csv_column)
         raise ValueError(f"Invalid ID format: {id_csv_column}")
+    return formatted_id
 
 
 def process_csv(
         input_csv_path: str,
         csv_separator: str,
         id_csv_column: str,
-        output_csv_path: str) -> None:
+        output_csv_path: str) -> Dict[str, List[str]]:
     """
     Processes the CSV file to group owners by parcel ID and exports the data.
     If an invalid ID format is detected, processing stops and logs an error.
 
+    The grouped data is also returned, in the same shape as read_csv gives
+    for the exported file, so callers do not need to read that file back.
+
     Parameters:
     input_csv_path (str): Path to the input CSV file.
     csv_separator (str): The separator used in the CSV file.
     id_csv_column (str): The name of the column containing the parcel ID.
     output_csv_path (str): Path to the output CSV file.
+
+    Returns:
+    dict: A dictionary mapping parcel IDs to lists of owners.
     """
+    # Start from an empty ID cache so memory is bounded by this file's IDs.
+    format_id_csv_column_or_none.cache_clear()
+
     # Create a default dictionary to store owners by their formatted parcel ID.
     owners_by_parcel = defaultdict(list)
 
     # Log the paths of the CSV
-    logging.info(f"Reading CSV from: {input_csv_path}")
+    logging.info("Reading CSV from: %s", input_csv_path)
 
-    # Open the input CSV file and read it using a DictReader.
-    with open(input_csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile, delimiter=csv_separator)
+    # Open the input CSV file and read it using a plain reader: only two
+    # columns are used, so building a dict per row would be wasted work.
+    # A 1 MiB read buffer keeps the parser fed with few, large reads.
+    with open(input_csv_path, newline='', encoding='utf-8',
+              buffering=1 << 20) as csvfile:
+        reader = csv.reader(csvfile, delimiter=csv_separator)
+        # Resolve the positions of the ID and owners columns from the header.
+        header = next(reader, [])
+        id_index = header.index(id_csv_column)
+        owners_index = header.index(_OWNERS_COLUMN)
+        # Bind the formatter to a local name for the hot loop.
+        format_id = format_id_csv_column_or_none
         for row in reader:
-            # Attempt to format each 'Bg Emplacement' value to the required ID
-            # format.
-            try:
-                formatted_id = format_id_csv_column(row[id_csv_column])
-            except ValueError as e:
+            # Skip blank lines, as csv.DictReader used to.
+            if not row:
+                continue
+            # Format each 'Bg Emplacement' value to the required ID format.
+            formatted_id = format_id(row[id_index])
+            if formatted_id is None:
                 # Log the error and stop processing if the ID is invalid.
-                logging.error(f"Failed to process the CSV file: {e}")
+                logging.error(
+                    "Failed to process the CSV file: Invalid ID format: %s", row[id_index])
                 # Optionally, inform the user and exit or ask for a correct
                 # column name.
                 print(
@@ -101,43 +161,71 @@ def process_csv(
                 raise ValueError(
                     "Invalid ID format found. Check the CSV file for errors or choose another column for the ID.")
 
-            # If the ID is valid, split the owner names and add them to the
-            # dictionary.
-            owners = row['Nom complet du proprietaire [BG]'].split(', ')
-            owners_by_parcel[formatted_id].extend(owners)
+            # If the ID is valid, keep the owner cell as it is: it is already
+            # a ', '-joined string, so splitting it here only to join it again
+            # on export would be wasted work.
+            # Intern the ID: parcels with several owners span several rows,
+            # and all of them then share one key string in the dictionary.
+            owners_by_parcel[sys.intern(formatted_id)].append(
+                row[owners_index])
+
+    # Join each parcel's owner cells once, in place so that a second
+    # dictionary is never built next to this one. Only values are replaced,
+    # which is safe while iterating.
+    for parcel_id, owners in owners_by_parcel.items():
+        owners_by_parcel[parcel_id] = ', '.join(owners)
 
-        # After processing all rows without error, export the data to a CSV
-        # file.
-        export_to_csv(owners_by_parcel, output_csv_path, csv_separator)
+    # After processing all rows without error, export the joined owners to a
+    # CSV file.
+    _write_owners_csv(owners_by_parcel.items(), output_csv_path, csv_separator)
 
+    # Split the same strings as read_csv would split the exported cells.
+    for parcel_id, owners in owners_by_parcel.items():
+        owners_by_parcel[parcel_id] = owners.split(', ')
+    # Missing IDs must not be added by lookups from now on.
+    owners_by_parcel.default_factory = None
+    return owners_by_parcel
 
-def read_csv(input_csv_path: str, csv_separator: str) -> None:
+
+def stream_csv(input_csv_path: str, csv_separator: str) -> Iterator[Tuple[str, List[str]]]:
     """
-    Reads a CSV file and returns a dictionary of owners by parcel.
+    Reads a CSV file exported by export_to_csv and yields its rows one at a time.
 
     Args:
     input_csv_path (str): Path to the input CSV file.
     csv_separator (str): The separator used in the CSV file.
 
-    Returns:
-    dict: A dictionary with the processed data from the CSV file.
+    Yields:
+    tuple: The parcel ID and the list of its owners, for each row.
     """
-    # Initialize an empty dictionary to hold the data.
-    owners_by_parcel = {}
     try:
-        with open(input_csv_path, 'r', encoding='utf-8') as csvfile:
+        # A 1 MiB read buffer keeps the parser fed with few, large reads.
+        with open(input_csv_path, 'r', newline='', encoding='utf-8',
+                  buffering=1 << 20) as csvfile:
             reader = csv.reader(csvfile, delimiter=csv_separator)
             next(reader)  # Skip the header
-            for row in reader:
-                # Store each row's data in the dictionary.
-                parcel_id, owners = row
-                owners_by_parcel[parcel_id] = owners.split(', ')
+            for parcel_id, owners in reader:
+                yield parcel_id, owners.split(', ')
     except Exception as e:
         # Log any exceptions that occur during reading.
-        logging.error(f"Failed to read the CSV file: {e}")
+        logging.error("Failed to read the CSV file: %s", e)
         raise
 
-    return owners_by_parcel
+
+def read_csv(input_csv_path: str, csv_separator: str) -> Dict[str, List[str]]:
+    """
+    Reads a CSV file and returns a dictionary of owners by parcel.
+
+    Args:
+    input_csv_path (str): Path to the input CSV file.
+    csv_separator (str): The separator used in the CSV file.
+
+    Returns:
+    dict: A dictionary with the processed data from the CSV file.
+    """
+    # Build the dictionary directly from the streamed rows, without an
+    # intermediate list of them.
+    return dict(stream_csv(input_csv_path, csv_separator))
 
 
 def export_to_csv(owners_by_parcel: Dict[str, List[str]], output_csv_path: str, csv_separator: str = ',') -> None:
@@ -148,13 +236,31 @@ def export_to_csv(owners_by_parcel: Dict[str, List[str]], output_csv_path: str,
     output_csv_path (str): Path to the output CSV file.
     csv_separator (str): Separator used in the CSV file.
     """
+    # Join each parcel's owners into the single cell written for it.
+    _write_owners_csv(((parcel_id, ', '.join(owners))
+                       for parcel_id, owners in owners_by_parcel.items()),
+                      output_csv_path, csv_separator)
+
+
+def _write_owners_csv(rows: Iterable[Tuple[str, str]], output_csv_path: str, csv_separator: str) -> None:
+    """Writes (parcel ID, joined owners) rows to a CSV file, after its header.
+
+    Args:
+    rows (iterable): The parcel IDs and their owners, already joined with ', '.
+    output_csv_path (str): Path to the output CSV file.
+    csv_separator (str): Separator used in the CSV file.
+    """
     try:
-        with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        # A 1 MiB buffer coalesces the many small row writes into few syscalls.
+        with open(output_csv_path, 'w', newline='', encoding='utf-8',
+                  buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile, delimiter=csv_separator)
             writer.writerow(['Parcel ID', 'Owners'])
-            for parcel_id, owners in owners_by_parcel.items():
-                # Write each parcel ID and its corresponding owners.
-                writer.writerow([parcel_id, ', '.join(owners)])
-        logging.info(f"Data successfully exported to {output_csv_path}")
+            # Write each parcel ID and its corresponding owners in a single call.
+            writer.writerows(rows)
+        logging.info("Data successfully exported to %s", output_csv_path)
     except Exception as e:
-        logging.error(f"Error exporting data to CSV: {e}")
+        # Log the error and re-raise it, so the caller does not report success
+        # without the exported file.
+        logging.error("Error exporting data to CSV: %s", e)
+        raise
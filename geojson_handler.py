@@ -12,99 +12,168 @@ Dependencies:
     - os: For interacting with the operating system, especially for file path manipulations and checking file existence.
     - csv: For operations related to CSV file handling, specifically for exporting inconsistencies.
     - time: For tracking the duration of the processing tasks.
+    - sys: For interning the individual owner property names.
+    - functools: For caching parsed GeoJSON files across runs in the same process.
 
 Features and Functions:
-    - read_geojson: Reads and returns the content of a GeoJSON file specified by the input path.
+    - configure_logging: Sets the working directory, the 'outputs' folder and the log handlers, once.
+    - read_geojson: Reads and returns the content of a GeoJSON file specified by the input path,
+    caching it by path, modification time and size.
     - write_geojson: Writes the given data to a GeoJSON file at the specified output path.
-    - export_inconsistencies: Exports a dictionary of inconsistencies to a CSV file
+    - export_inconsistencies: Exports a collection of inconsistent parcel IDs to a CSV file
     - confirm_overwrite: Prompts the user for confirmation before overwriting an existing file
     - process_geojson: Processes an input GeoJSON file by updating it with owner information from a provided dictionary
 """
 
 import json
 import logging
+import logging.handlers
 import os
 import csv
+import sys
 import time
-from typing import Dict, List
+from functools import lru_cache
+from typing import Iterable
 
-# Get the directory where the script is located
-script_dir = os.path.dirname(os.path.abspath(__file__))
+# Set once configure_logging has run, so repeated calls do nothing
+_logging_configured = False
 
-# Sets the current working directory to the project root directory
-# This confirms the good export of the files in the "outputs" folder
-os.chdir(script_dir)
 
-# Create the log directory if it does not exist
-log_directory = os.path.join(os.path.dirname(
-    os.path.abspath(__file__)), 'outputs')
-if not os.path.exists(log_directory):
-    os.makedirs(log_directory)
-
-# Configure logging
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-# Logging to file
-file_handler = logging.FileHandler(os.path.join(log_directory, 'project.log'))
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(levelname)s - %(message)s'))
-
-# Logging to console
-stream_handler = logging.StreamHandler()
-stream_handler.setLevel(logging.INFO)
-stream_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(levelname)s - %(message)s'))
+def configure_logging() -> None:
+    """
+    Prepares the environment for processing: sets the working directory to the
+    project root, creates the 'outputs' folder, and attaches the file and
+    console log handlers to the root logger.
 
-# Adding handlers to the logger
-logger.addHandler(file_handler)
-logger.addHandler(stream_handler)
+    Called once by the entry points (main.py, gui.py) rather than at import,
+    and safe to call again: handlers are only attached on the first call, and
+    a file handler already installed by config_manager is not duplicated.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
+    # Get the directory where the script is located
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Sets the current working directory to the project root directory
+    # This confirms the good export of the files in the "outputs" folder
+    os.chdir(script_dir)
+
+    # Create the log directory if it does not exist
+    log_directory = os.path.join(script_dir, 'outputs')
+    os.makedirs(log_directory, exist_ok=True)
+
+    # Configure logging
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    # Logging to file, unless the log file is already handled
+    if not any(isinstance(handler, (logging.FileHandler, logging.handlers.QueueHandler))
+               for handler in logger.handlers):
+        file_handler = logging.FileHandler(
+            os.path.join(log_directory, 'project.log'))
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+
+    # Logging to console
+    if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
+        stream_handler = logging.StreamHandler()
+        stream_handler.setLevel(logging.INFO)
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
+
+
+@lru_cache(maxsize=4)
+def _read_geojson_cached(input_geojson_path: str, mtime_ns: int, size: int) -> dict:
+    """Parses a GeoJSON file; the modification time and size only key the cache."""
+    with open(input_geojson_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
 
 
 def read_geojson(input_geojson_path: str) -> dict:
-    """Reads a GeoJSON file and returns its content."""
+    """
+    Reads a GeoJSON file and returns its content.
+
+    The parsed content is cached by path, modification time and size, so
+    submitting the same input again (e.g. from the GUI with other options)
+    skips the parse. The returned dictionary is shared with the cache and must
+    not be modified: process_geojson copies the features it updates.
+    """
 
     # Log the paths of the CSV and JSON files
-    logging.info(f"Reading JSON from: {input_geojson_path}")
+    logging.info("Reading JSON from: %s", input_geojson_path)
     try:
-        with open(input_geojson_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        stat = os.stat(input_geojson_path)
+        return _read_geojson_cached(
+            os.path.abspath(input_geojson_path), stat.st_mtime_ns, stat.st_size)
     except Exception as e:
-        logging.error(f'Error reading the GeoJSON file: {e}')
+        logging.error('Error reading the GeoJSON file: %s', e)
         raise
 
 
 def write_geojson(data: dict, output_geojson_path: str) -> None:
-    """Writes data to a GeoJSON file."""
+    """
+    Writes data to a GeoJSON file.
+
+    The features are serialized and written one at a time, one per line like
+    the cadastre files, so the whole document is never held in memory as a
+    single string. They go to a temporary file that replaces the output only
+    once complete, so a failed run never leaves a truncated GeoJSON behind.
+    """
+    temporary_path = output_geojson_path + '.tmp'
     try:
-        with open(output_geojson_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+        # Every top-level member except the features, e.g. 'type' or 'crs'
+        header = {key: value for key,
+                  value in data.items() if key != 'features'}
+        # Serialize each piece with one-shot json.dumps without indentation:
+        # it then runs entirely in the C encoder, whereas json.dump or
+        # indent=4 fall back to the pure-Python encoder.
+        with open(temporary_path, 'w', encoding='utf-8',
+                  buffering=1 << 20) as file:
+            file.write(json.dumps(header, ensure_ascii=False)[:-1])
+            file.write(',"features":[\n' if header else '"features":[\n')
+            for index, feature in enumerate(data.get('features', [])):
+                if index:
+                    file.write(',\n')
+                file.write(json.dumps(feature, ensure_ascii=False))
+            file.write('\n]}\n')
+        # Atomically swap the complete file in place of the output
+        os.replace(temporary_path, output_geojson_path)
         logging.info(
-            f'GeoJSON file successfully written: {output_geojson_path}')
+            'GeoJSON file successfully written: %s', output_geojson_path)
     except Exception as e:
-        logging.error(f'Error writing the GeoJSON file: {e}')
+        logging.error('Error writing the GeoJSON file: %s', e)
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
         raise
 
 
 def export_inconsistencies(
-        inconsistencies: Dict[str, List[str]], output_path: str, csv_separator: str = ',') -> None:
+        inconsistencies: Iterable[str], output_path: str, csv_separator: str = ',') -> None:
     """
     Export inconsistencies to a specified CSV file.
 
-    :param inconsistencies: A list of inconsistencies to be exported.
+    :param inconsistencies: The parcel IDs of the inconsistencies to be exported.
     :param output_path: The path where the inconsistencies CSV should be saved.
     :param csv_separator: The CSV separator to use.
     """
     try:
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        # A 1 MiB buffer coalesces the many small row writes into few syscalls.
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile, delimiter=csv_separator)
             writer.writerow(['Parcel ID', 'Reason'])
-            for parcel_id in inconsistencies:
-                writer.writerow([parcel_id, 'No matching owner data'])
-        logging.info(f"Inconsistencies exported to {output_path}")
+            # Write all the rows in a single call to the csv C extension
+            reason = 'No matching owner data'
+            writer.writerows((parcel_id, reason)
+                             for parcel_id in inconsistencies)
+        logging.info("Inconsistencies exported to %s", output_path)
     except Exception as e:
-        logging.error(f"Error exporting inconsistencies to CSV: {e}")
+        logging.error("Error exporting inconsistencies to CSV: %s", e)
 
 
 def confirm_overwrite(file_path: str) -> bool:
@@ -124,7 +193,9 @@ def process_geojson(
         individual_prop_base_name: str,
         inconsistencies_csv_path: str,
         inconsistencies_json_path: str,
-        overwrite_mode: str = 'ask') -> None:
+        overwrite_mode: str = 'ask',
+        use_array: bool = False,
+        geojson_data: dict = None) -> None:
     """
     Processes a GeoJSON file to update property data and manage data inconsistencies.
     This function takes the path to an input GeoJSON file and updates it with owner information
@@ -142,9 +213,15 @@ def process_geojson(
         inconsistencies_json_path (str): Path to export any inconsistencies found in the GeoJSON dataset.
         overwrite_mode (str): Determines the mode of confirmation for file overwriting. It can be 'ask'
                               for terminal-based confirmation or 'gui' for GUI-based confirmation.
+        use_array (bool): If True, the individual owners are stored as a single JSON array property
+                          named `individual_prop_base_name` (e.g. "Propriétaire": ["A", "B"]) instead
+                          of one numbered property per owner ("Propriétaire 1", "Propriétaire 2", ...).
+        geojson_data (dict): The content of the input GeoJSON file, if it was already read with
+                             read_geojson (e.g. in the background while the CSV was processed).
+                             It is read from `input_geojson_path` when not given.
 
     Processing Steps:
-        - Reads the input GeoJSON file.
+        - Reads the input GeoJSON file, if its content was not given.
         - Iterates over each feature, updating owner information from the `owners_by_parcel` mapping.
         - Checks for parcels present in the GeoJSON but not in the CSV (and vice versa) and reports them.
         - Handles file overwriting based on the provided `overwrite_mode`.
@@ -154,67 +231,111 @@ def process_geojson(
         bool: False if the operation was cancelled by the user during overwrite confirmation, True otherwise.
     """
     # Log the commencement of the processing with the specified property names
-    logging.info(f"Processing GeoJSON with prop_name: {prop_name}")
+    logging.info("Processing GeoJSON with prop_name: %s", prop_name)
     logging.info(
-        f"Processing GeoJSON with individual_prop_name: {individual_prop_base_name}")
+        "Processing GeoJSON with individual_prop_name: %s", individual_prop_base_name)
 
     # Record the start time for performance measurement
     start_time = time.time()
 
-    # Read the existing GeoJSON data from the provided file path
-    geojson_data = read_geojson(input_geojson_path)
+    # Read the existing GeoJSON data from the provided file path, unless the
+    # caller has already read it
+    if geojson_data is None:
+        geojson_data = read_geojson(input_geojson_path)
 
-    # Initialize counters for processed parcels and lists for inconsistencies
+    # Initialize counters for processed parcels and sets for inconsistencies,
+    # so that a parcel ID repeated in the data is only reported once
     processed_count = 0
-    json_inconsistencies = []
-    csv_inconsistencies = []
+    missing_id_count = 0
+    json_inconsistencies = set()
 
     # Iterate through each feature (parcel) in the GeoJSON data
+    # The GeoJSON IDs are collected along the way as a set, to find the CSV
+    # parcels missing from the GeoJSON without walking the features again
+    geojson_ids = set()
+    # Names of the individual owner properties ('<base name> 1', '<base name> 2',
+    # ...), built once and shared by all features instead of per owner
+    individual_prop_names = []
+    # Joined owner strings by parcel ID, computed the first time a parcel is
+    # matched and reused if its ID appears on several features
+    joined_owners = {}
+    # The input data may be shared with the read_geojson cache, so updated
+    # features are shallow copies collected in a new list
+    output_features = []
     for feature in geojson_data['features']:
-        parcel_id = feature['properties'].get('id', None)
-        if parcel_id in owners_by_parcel:
-            # Update feature properties with owners
-            feature['properties'][prop_name] = ', '.join(
-                owners_by_parcel[parcel_id])
+        # Look the properties dictionary up once per feature
+        props = feature['properties']
+        parcel_id = props.get('id')
+        if parcel_id is None:
+            # A feature without an ID (or with a null one) can match nothing:
+            # count it apart instead of reporting a None parcel ID as an
+            # inconsistency
+            missing_id_count += 1
+            output_features.append(feature)
+            continue
+        geojson_ids.add(parcel_id)
+        # A single lookup both tests membership and fetches the owners
+        owners = owners_by_parcel.get(parcel_id)
+        if owners is not None:
+            # Update a copy of the feature properties with owners; the
+            # geometry is shared, not copied
+            props = dict(props)
+            feature = {**feature, 'properties': props}
+            joined = joined_owners.get(parcel_id)
+            if joined is None:
+                joined = joined_owners[parcel_id] = ', '.join(owners)
+            props[prop_name] = joined
             # Add individual owner properties if a base name is provided
-            if individual_prop_base_name:
-                for i, owner in enumerate(
-                        owners_by_parcel[parcel_id], start=1):
-                    feature['properties'][f'{individual_prop_base_name} {i}'] = owner
+            if individual_prop_base_name and use_array:
+                props[individual_prop_base_name] = list(owners)
+            elif individual_prop_base_name:
+                while len(individual_prop_names) < len(owners):
+                    individual_prop_names.append(sys.intern(
+                        f'{individual_prop_base_name} {len(individual_prop_names) + 1}'))
+                for i, owner in enumerate(owners):
+                    props[individual_prop_names[i]] = owner
             processed_count += 1
         else:
-            json_inconsistencies.append(parcel_id)
+            json_inconsistencies.add(parcel_id)
+        output_features.append(feature)
+    output_data = {**geojson_data, 'features': output_features}
 
     # Check for parcels that are in the CSV but not in the GeoJSON
-    for parcel_id in owners_by_parcel:
-        if parcel_id not in [feature['properties'].get(
-                'id') for feature in geojson_data['features']]:
-            csv_inconsistencies.append(parcel_id)
+    csv_inconsistencies = {
+        parcel_id for parcel_id in owners_by_parcel if parcel_id not in geojson_ids}
 
     # Log processing time and counts
     elapsed_time = time.time() - start_time
-    logging.info(f"GeoJSON processed in {elapsed_time:.2f} seconds")
-    logging.info(f"Total of {processed_count} parcels processed")
+    logging.info("GeoJSON processed in %.2f seconds", elapsed_time)
+    logging.info("Total of %d parcels processed", processed_count)
+
+    if missing_id_count:
+        logging.warning(
+            "%d features without an 'id' property skipped", missing_id_count)
 
     # Export any found inconsistencies to specified paths
     if json_inconsistencies:
         logging.warning(
-            f"{len(json_inconsistencies)} parcels found in JSON but not in CSV")
-        export_inconsistencies(json_inconsistencies, inconsistencies_json_path)
+            "%d parcels found in JSON but not in CSV", len(json_inconsistencies))
+        # Sort for a stable output, comparing as strings so that IDs of
+        # mixed types never make the sort fail
+        export_inconsistencies(
+            sorted(json_inconsistencies, key=str), inconsistencies_json_path)
 
     if csv_inconsistencies:
         logging.warning(
-            f"{len(csv_inconsistencies)} parcels found in CSV but not in JSON")
-        export_inconsistencies(csv_inconsistencies, inconsistencies_csv_path)
+            "%d parcels found in CSV but not in JSON", len(csv_inconsistencies))
+        export_inconsistencies(
+            sorted(csv_inconsistencies, key=str), inconsistencies_csv_path)
 
     # Handle file overwriting confirmation based on mode
     if overwrite_mode == 'gui':
         # GUI mode: proceed without asking in terminal
-        write_geojson(geojson_data, output_geojson_path)
+        write_geojson(output_data, output_geojson_path)
     else:
         # Terminal mode: ask for confirmation in terminal
         if confirm_overwrite(output_geojson_path):
-            write_geojson(geojson_data, output_geojson_path)
+            write_geojson(output_data, output_geojson_path)
         else:
             logging.info("Operation cancelled by the user.")
             return False  # Indicate cancellation
@@ -11,10 +11,13 @@ Dependencies:
     - csv_handler: Handles CSV file processing.
     - geojson_handler: Manages GeoJSON file processing.
     - os, csv: Standard Python modules for operating system interactions and CSV file operations.
+    - threading: Runs the file processing outside of the Tk main loop.
     - logging: Provides logging functionalities.
+    - collections: Provides the deque buffering log messages before they reach the widget.
 
 Main Components:
-    - TextHandler: A custom logging handler that directs logging output to a Tkinter Text widget
+    - TextHandler: A custom logging handler that directs logging output to a Tkinter Text widget,
+    flushing buffered records in batches on a Tk timer
     - configure_logging: Configures the application's logging to output to the specified Tkinter Text widget.
     - browse_file, browse_folder: Functions to open file and folder dialog windows, 
     allowing the user to select files or directories and display their paths in the GUI.
@@ -22,6 +25,7 @@ Main Components:
     including the separator and column names, ensuring compatibility with processing expectations.
     - submit(): The main function that handles the submission from the GUI,
     validating inputs and initiating the processing of selected files.
+    - process_files(): Processes the selected files in a background thread and reports the result.
 
 Usage:
 The module is designed to be run as a standalone application. 
@@ -36,12 +40,14 @@ Features:
     - Configuration management through external modules.
     - Processing of CSV and GeoJSON files with customizable options.
 """
+import collections
 import config_manager
 import csv
 import csv_handler
 import geojson_handler
 import logging
 import os
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, simpledialog, messagebox
 
@@ -50,35 +56,58 @@ class TextHandler(logging.Handler):
     """
     A custom logging handler that directs logging output to a Tkinter Text widget.
 
+    Records are buffered and written to the widget in batches from a Tk timer,
+    so a burst of log lines costs one widget update instead of one per line.
+
     Attributes:
         text_widget (tk.Text): The Tkinter Text widget to which log messages are directed.
+        flush_interval (int): Delay in milliseconds between two flushes of the buffer.
+        max_lines (int): Maximum number of log lines kept in the widget; older lines are dropped.
     """
 
-    def __init__(self, text_widget: tk.Text):
+    def __init__(self, text_widget: tk.Text, flush_interval: int = 50, max_lines: int = 5000):
         """
         Initialize the handler with the Tkinter Text widget.
 
         Args:
             text_widget (tk.Text): A Tkinter Text widget instance.
+            flush_interval (int): Delay in milliseconds between two flushes of the buffer.
+            max_lines (int): Maximum number of log lines kept in the widget.
         """
         super().__init__()
         self.text_widget = text_widget
+        self.flush_interval = flush_interval
+        self.max_lines = max_lines
+        self._buffer = collections.deque()
+        self.text_widget.after(self.flush_interval, self._flush)
 
     def emit(self, record: logging.LogRecord):
         """
-        Override the emit function to log a record to the text widget.
+        Override the emit function to buffer a record for the text widget.
 
         Args:
             record (logging.LogRecord): Log record, which is a LogRecord object.
         """
-        msg = self.format(record)  # Format the log message
-        # Safely make changes to the text widget
-        self.text_widget.configure(state='normal')
-        # Append the message to the widget
-        self.text_widget.insert(tk.END, msg + '\n')
-        # Disable editing of the widget
-        self.text_widget.configure(state='disabled')
-        self.text_widget.yview(tk.END)  # Auto-scroll to the end of the widget
+        self._buffer.append(self.format(record))  # Format the log message
+
+    def _flush(self):
+        """Writes the buffered messages to the text widget and reschedules itself."""
+        if self._buffer:
+            messages = []
+            while self._buffer:
+                messages.append(self._buffer.popleft())
+            # Safely make changes to the text widget
+            self.text_widget.configure(state='normal')
+            # Append all the messages to the widget at once
+            self.text_widget.insert(tk.END, '\n'.join(messages) + '\n')
+            # Drop the oldest lines so the widget size stays bounded
+            lines = int(self.text_widget.index('end-1c').split('.')[0])
+            if lines - 1 > self.max_lines:
+                self.text_widget.delete('1.0', f'{lines - self.max_lines}.0')
+            # Disable editing of the widget
+            self.text_widget.configure(state='disabled')
+            self.text_widget.yview(tk.END)  # Auto-scroll to the end of the widget
+        self.text_widget.after(self.flush_interval, self._flush)
 
 
 def configure_logging(log_text: tk.Text):
@@ -120,9 +149,11 @@ def browse_folder(entry: str) -> str:
         entry.insert(0, foldername)
 
 
-def validate_csv_separator(csv_file: str, separator: str, expected_column: int) -> bool:
+def validate_csv_separator(csv_file: str, separator: str, expected_column: int, header: str = None) -> bool:
     """
     Attempts to read the CSV file with the provided separator and checks for the expected column.
+    If the first line of the file is passed as header, the file is not reopened,
+    so retrying with another separator only re-checks that line in memory.
     Returns:
     - True if the column is found with the exact name.
     - 'wrong_case' if the column is found with a different case.
@@ -131,22 +162,22 @@ def validate_csv_separator(csv_file: str, separator: str, expected_column: int)
     - False if an error occurs.
     """
     try:
-        with open(csv_file, 'r', encoding='utf-8') as csvfile:
-            # Vamos tentar ler o cabeçalho do arquivo para verificar o separador e a coluna
-            header = csvfile.readline()
-            if separator not in header:
-                return 'wrong_separator'
+        if header is None:
+            with open(csv_file, 'r', encoding='utf-8') as csvfile:
+                # Vamos tentar ler o cabeçalho do arquivo para verificar o separador e a coluna
+                header = csvfile.readline()
+        if separator not in header:
+            return 'wrong_separator'
+        else:
+            # Split the header line alone with csv.reader (which handles
+            # quoting) to get the column names
+            fieldnames = next(csv.reader([header], delimiter=separator), [])
+            if expected_column in fieldnames:
+                return True
+            elif any(expected_column.lower() == col.lower() for col in fieldnames):
+                return 'wrong_case'
             else:
-                # Retorna ao início do arquivo para a leitura do csv
-                csvfile.seek(0)
-                reader = csv.DictReader(csvfile, delimiter=separator)
-                fieldnames = reader.fieldnames
-                if expected_column in fieldnames:
-                    return True
-                elif any(expected_column.lower() == col.lower() for col in fieldnames):
-                    return 'wrong_case'
-                else:
-                    return 'wrong_column'
+                return 'wrong_column'
     except Exception as e:
         messagebox.showerror(
             "Erreur de validation CSV",
@@ -202,11 +233,23 @@ def submit():
                                "Veuillez sélectionner un répertoire de sortie valide.")
         return
 
+    # Read the CSV header once, so that retries with another separator do not reopen the file
+    try:
+        with open(csv_file, 'r', encoding='utf-8') as csvfile:
+            csv_header = csvfile.readline()
+    except Exception as e:
+        messagebox.showerror(
+            "Erreur de validation CSV",
+            f"Une erreur est survenue lors de la validation du séparateur CSV : {e}"
+        )
+        return
+
     # Validate the CSV separator with the user until a valid one is provided or the user cancels
     separator_valid = False
     column_name_correct = False
     while not separator_valid or not column_name_correct:
-        result = validate_csv_separator(csv_file, csv_separator, csv_id_column)
+        result = validate_csv_separator(
+            csv_file, csv_separator, csv_id_column, csv_header)
         if result == True:
             separator_valid = True
             column_name_correct = True
@@ -253,18 +296,14 @@ def submit():
                                     "Le processus a été annulé par l'utilisateur.")
                 return
 
-        # Process the files with the provided paths
-        try:
-            csv_handler.process_csv(
-                csv_file, csv_separator, csv_id_column, output_csv_path)
-            csv_data = csv_handler.read_csv(output_csv_path, csv_separator)
-            geojson_handler.process_geojson(json_file, output_geojson_path, csv_data, 'Propriétaires',
-                                            'Propriétaire', inconsistencies_csv_path, inconsistencies_json_path, overwrite_mode='gui')
-            messagebox.showinfo(
-                "Succès", "Les fichiers ont été traités avec succès.")
-        except Exception as e:
-            messagebox.showerror("Erreur de traitement",
-                                 f"Erreur lors du traitement des fichiers : {e}")
+        # Process the files with the provided paths in a background thread,
+        # so the window stays responsive and the logs show up as they come
+        submit_button.state(['disabled'])
+        threading.Thread(
+            target=process_files,
+            args=(json_file, csv_file, csv_separator, csv_id_column, output_csv_path,
+                  output_geojson_path, inconsistencies_csv_path, inconsistencies_json_path),
+            daemon=True).start()
     else:
         messagebox.showerror(
             "Erreur de validation CSV",
@@ -272,6 +311,34 @@ def submit():
         )
 
 
+def process_files(
+        json_file: str,
+        csv_file: str,
+        csv_separator: str,
+        csv_id_column: str,
+        output_csv_path: str,
+        output_geojson_path: str,
+        inconsistencies_csv_path: str,
+        inconsistencies_json_path: str) -> None:
+    """
+    Processes the CSV and GeoJSON files. Meant to run in a worker thread:
+    Tkinter is not thread-safe, so the result dialogs and the re-enabling of
+    the submit button are scheduled on the main loop with root.after.
+    """
+    try:
+        csv_data = csv_handler.process_csv(
+            csv_file, csv_separator, csv_id_column, output_csv_path)
+        geojson_handler.process_geojson(json_file, output_geojson_path, csv_data, 'Propriétaires',
+                                        'Propriétaire', inconsistencies_csv_path, inconsistencies_json_path, overwrite_mode='gui')
+        root.after(0, lambda: messagebox.showinfo(
+            "Succès", "Les fichiers ont été traités avec succès."))
+    except Exception as e:
+        root.after(0, lambda error=e: messagebox.showerror(
+            "Erreur de traitement", f"Erreur lors du traitement des fichiers : {error}"))
+    finally:
+        root.after(0, lambda: submit_button.state(['!disabled']))
+
+
 def confirm_column_name(csv_file: str, separator: str, expected_column: str) -> bool:
     """
     Check if the column name is the issue rather than the separator.
@@ -402,5 +469,7 @@ log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 log_text.configure(yscrollcommand=log_scrollbar.set)
 # Configure logging to direct logs to the log_text widget
 configure_logging(log_text)
+# Set up the working directory, the outputs folder and the file/console logs
+geojson_handler.configure_logging()
 # Run the application's main event loop
 root.mainloop()
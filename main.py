@@ -6,20 +6,25 @@ to guide the processing of CSV and GeoJSON files.
 
 Dependencies:
     - os: For interacting with the operating system, especially for file and directory operations.
+    - concurrent.futures: For reading the GeoJSON file in the background while the CSV is processed.
     - config_manager: Manages application configuration, loading settings from files or command-line arguments.
+    - csv: For catching the errors raised on malformed CSV files.
     - csv_handler: Provides functionalities for processing CSV files, including validation and formatting.
     - geojson_handler: Handles the processing of GeoJSON files, integrating CSV data based on configuration.
     - logging: Used for logging information, warnings, and errors throughout the processing workflow.
-    - sys: Enables interaction with the Python interpreter, particularly for exiting the program with status codes.
-    - utils: Contains utility functions, such as validating the CSV file separator.
+    - pathlib: For building the output file paths.
+    - sys: For checking whether standard input is a terminal before prompting the user.
+    - utils: Contains utility functions, such as validating and detecting the CSV file separator.
 
 Workflow Overview:
     1. Configuration is loaded from a file or command-line arguments, establishing the parameters for processing.
     2. The existence of the output directory is verified, and it is created if it does not exist.
     3. The CSV file separator is validated against the expected format. 
-    If a mismatch is detected, the user is prompted to provide the correct separator.
+    If a mismatch is detected, a fallback separator is taken from the --fallback_separator
+    option, the CSV_SEP_FALLBACK environment variable or the CSV header, in that order.
+    The user is prompted for it only as a last resort, and only when running in a terminal.
     4. The CSV file is processed to match the expected format, and results are outputted to specified paths.
-    5. Processed CSV data is read and used to update a GeoJSON file according to the configurations specified.
+    5. Processed CSV data, kept in memory, is used to update a GeoJSON file according to the configurations specified.
     6. Errors and exceptions encountered during processing are logged,
     and the program exits with a non-zero status if critical issues occur.
 
@@ -27,17 +32,76 @@ Exception Handling:
 The module employs exception handling to ensure that any errors encountered during the configuration loading,
 CSV processing, or GeoJSON processing are logged. 
 This approach facilitates troubleshooting by providing detailed
-error messages and exits the program with an appropriate status code to indicate failure.
+error messages and exits the program with an appropriate status code to indicate failure:
+    - 0: Success.
+    - 1: Configuration or CSV separator error (also the status Python uses when an
+    unexpected exception ends the program with a traceback).
+    - 2: Invalid command-line arguments, reported by argparse.
+    - 3: CSV processing error.
+    - 4: GeoJSON processing error.
 """
 
 import os
 import config_manager
-import csv_handler
+import csv
 import geojson_handler
 import logging
+import pathlib
 import sys
 import utils
 
+# Output paths, relative to the script directory set up by config_manager.
+# Built once at import time rather than on every run of main, and kept as
+# strings since that is what the handlers expect.
+OUTPUTS_DIR = pathlib.Path('outputs')
+OUTPUT_CSV_PATH = str(OUTPUTS_DIR / 'parcelles_edited.csv')
+INCONSISTENCIES_CSV_PATH = str(OUTPUTS_DIR / 'inconsistencies_csv.csv')
+INCONSISTENCIES_JSON_PATH = str(OUTPUTS_DIR / 'inconsistencies_json.csv')
+
+# Exit statuses, one per stage that can fail, so that a calling script can
+# tell a bad configuration or separator from a bad CSV or GeoJSON file.
+# 2 is left to argparse, which exits with it on invalid command-line arguments.
+EXIT_CONFIG, EXIT_CSV, EXIT_GEOJSON = 1, 3, 4
+
+
+def _choose_fallback_separator(cfg_manager):
+    """
+    Chooses the separator to try when the configured one does not match the CSV file.
+
+    The sources are tried in order: the --fallback_separator option, the
+    CSV_SEP_FALLBACK environment variable, the separator detected in the CSV
+    header and, only when standard input is a terminal, a prompt. Batch runs
+    therefore never block waiting for an answer.
+
+    Returns the chosen separator, or None if there is none.
+    """
+    if cfg_manager.fallback_separator:
+        logging.info("Using the fallback CSV separator from the configuration: %r",
+                     cfg_manager.fallback_separator)
+        return cfg_manager.fallback_separator
+
+    env_separator = os.environ.get('CSV_SEP_FALLBACK')
+    if env_separator:
+        logging.info("Using the fallback CSV separator from CSV_SEP_FALLBACK: %r",
+                     env_separator)
+        return env_separator
+
+    # Use the separator found in the header when it is unambiguous
+    detected_separator = utils.detect_csv_separator(cfg_manager.input_csv_path)
+    if detected_separator is not None:
+        logging.warning(
+            "Detected CSV separator %r in the header, using it instead.",
+            detected_separator)
+        return detected_separator
+
+    if sys.stdin.isatty():
+        logging.info("Prompting for the CSV separator.")
+        return input("Please enter the correct CSV separator: ")
+
+    logging.error(
+        "No fallback CSV separator is set and there is no terminal to prompt on.")
+    return None
+
 
 def main():
     """
@@ -47,76 +111,105 @@ def main():
     - Loading configuration from a file or command-line arguments.
     - Validating and possibly correcting the CSV file separator.
     - Processing the CSV file to match expected formats and outputting results.
-    - Reading the processed CSV data.
+    - Keeping the processed CSV data in memory.
     - Processing the GeoJSON file with CSV data and configurations.
 
     Exception handling is utilized to log errors and exit the program with a non-zero status on failure.
     """
+    # Set up the working directory, the outputs folder and the log handlers
+    geojson_handler.configure_logging()
+
     try:
         # Load configuration from file or CLI arguments
         cfg_manager = config_manager.ConfigManager()
         cfg_manager.get_config()
 
         # Ensure output directory exists
-        outputs_dir = 'outputs'
-        if not os.path.exists(outputs_dir):
-            os.makedirs(outputs_dir)
+        os.makedirs(OUTPUTS_DIR, exist_ok=True)
 
         logging.info(
-            f"Selected ID column in .csv: {cfg_manager.id_csv_column}")
+            "Selected ID column in .csv: %s", cfg_manager.id_csv_column)
 
         # Validate the CSV file separator, prompt for correction if invalid
         if not utils.is_valid_csv_separator(
                 cfg_manager.input_csv_path,
                 cfg_manager.csv_separator):
             logging.error("CSV separator does not match the expected format.")
-            new_separator = input("Please enter the correct CSV separator: ")
+            new_separator = _choose_fallback_separator(cfg_manager)
+            if new_separator is None:
+                # Exit if no other separator could be found
+                raise SystemExit(EXIT_CONFIG)
+            # The same separator again is known to be wrong: skip the check
+            same_separator = new_separator == cfg_manager.csv_separator
             cfg_manager.csv_separator = new_separator
 
-            if not utils.is_valid_csv_separator(
+            if same_separator or not utils.is_valid_csv_separator(
                     cfg_manager.input_csv_path,
                     cfg_manager.csv_separator):
                 logging.error(
                     "CSV separator provided does not match the file format.")
                 # Exit if the CSV separator still does not match after
                 # correction
-                sys.exit(1)
-
-    except Exception as e:
-        logging.error(f"Configuration error or invalid CSV separator: {e}")
-        sys.exit(1)
-
-    output_csv_path = os.path.join(outputs_dir, 'parcelles_edited.csv')
-    inconsistencies_csv_path = os.path.join(
-        outputs_dir, 'inconsistencies_csv.csv')
-    inconsistencies_json_path = os.path.join(
-        outputs_dir, 'inconsistencies_json.csv')
+                raise SystemExit(EXIT_CONFIG)
 
-    # Process CSV file
-    try:
-        csv_handler.process_csv(
-            cfg_manager.input_csv_path,
-            cfg_manager.csv_separator,
-            cfg_manager.id_csv_column,
-            output_csv_path)
     except Exception as e:
-        sys.exit(1)
-
-    # Process GeoJSON file
+        logging.error("Configuration error or invalid CSV separator: %s", e)
+        raise SystemExit(EXIT_CONFIG)
+
+    # Import the CSV handler and the thread pool only now that the
+    # configuration and the separator are known to be valid, so that a failed
+    # check exits without loading them. geojson_handler is imported at the top
+    # of the module: it sets up the logging before anything is logged.
+    import csv_handler
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Exit status if an error occurs, updated as each stage starts
+    exit_code = EXIT_CSV
+
+    # Process the CSV and GeoJSON files. Only the errors expected from bad
+    # input files or options are handled here: unreadable files (OSError),
+    # malformed CSV (csv.Error), invalid IDs, missing columns or invalid JSON
+    # (ValueError, of which json.JSONDecodeError is a subclass), GeoJSON
+    # features missing an expected member (KeyError), CSV rows shorter than
+    # the header (IndexError), a separator that is empty or longer than one
+    # character (TypeError) and an overwrite confirmation asked for with no
+    # terminal to answer it (EOFError).
     try:
-        csv_data = csv_handler.read_csv(
-            output_csv_path, cfg_manager.csv_separator)
+        # Read the GeoJSON file in a worker thread while the CSV is processed,
+        # so that the disk reads of one file overlap the work on the other
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            geojson_future = executor.submit(
+                geojson_handler.read_geojson, cfg_manager.input_geojson_path)
+
+            # Process CSV file
+            csv_data = csv_handler.process_csv(
+                cfg_manager.input_csv_path,
+                cfg_manager.csv_separator,
+                cfg_manager.id_csv_column,
+                OUTPUT_CSV_PATH)
+
+        # Process GeoJSON file
+        # The grouped data comes back from process_csv; only read the
+        # exported file again if it did not.
+        if csv_data is None:
+            csv_data = csv_handler.read_csv(
+                OUTPUT_CSV_PATH, cfg_manager.csv_separator)
+        # Wait for the background read; its errors are raised here
+        exit_code = EXIT_GEOJSON
+        geojson_data = geojson_future.result()
         geojson_handler.process_geojson(
             cfg_manager.input_geojson_path,
             cfg_manager.output_geojson_path,
             csv_data,
             cfg_manager.prop_name,
             cfg_manager.individual_prop_name,
-            inconsistencies_csv_path,
-            inconsistencies_json_path)
-    except Exception as e:
-        logging.error(f"Error during GeoJSON processing: {e}")
-        sys.exit(1)
+            INCONSISTENCIES_CSV_PATH,
+            INCONSISTENCIES_JSON_PATH,
+            geojson_data=geojson_data)
+    except (OSError, csv.Error, ValueError, KeyError, IndexError,
+            TypeError, EOFError) as e:
+        logging.error("Error during CSV or GeoJSON processing: %s", e)
+        raise SystemExit(exit_code)
 
     # Optionally, insert additional logging or operations here
 if __name__ == '__main__':
@@ -1,17 +1,53 @@
 """
 Module for validating CSV file separators.
 
-This module provides a function to check if a given CSV file uses the expected separator character.
-It imports the logging module for error logging.
+This module provides a function to check if a given CSV file uses the expected separator character,
+and one to guess the separator of a CSV file from its header line.
+It imports the logging module for error logging, io for the size of the header read,
+and os to key its result cache on the file's modification time and size.
 """
 
+import io
 import logging
+import os
+from typing import Optional
+
+# Number of bytes read when looking for the header line: one default I/O
+# buffer (8 KiB on most platforms), enough for any realistic CSV header.
+_HEADER_SCAN_LIMIT = io.DEFAULT_BUFFER_SIZE
+
+# Results of is_valid_csv_separator, keyed by (absolute path, modification
+# time, size, separator), so that checking the same file again is free.
+_SEPARATOR_CACHE = {}
+
+# Separators that detect_csv_separator looks for in the header line.
+_CANDIDATE_SEPARATORS = (',', ';', '\t', '|')
+
+
+def _read_header(file_path: str) -> bytes:
+    """
+    Returns the first line of a file as raw bytes, without the newline.
+    Only the first block of the file is read, unbuffered and in binary mode;
+    if the first line is longer than the block, the whole block is returned.
+    """
+    with open(file_path, 'rb', buffering=0) as file:
+        buffer = file.read(_HEADER_SCAN_LIMIT)
+    # Keep only the first line, if it ends within the block
+    newline = buffer.find(b'\n')
+    return buffer if newline < 0 else buffer[:newline]
 
 
 def is_valid_csv_separator(file_path: str, expected_separator: str) -> bool:
     """
     Checks if the given CSV file uses the expected separator.
 
+    Only the first block of the file is read, unbuffered and in binary mode,
+    and its first line is searched as raw bytes, so nothing is decoded.
+    The separator is compared as its UTF-8 bytes, which for the usual ASCII
+    separators (',', ';', '\t', '|') is the single byte itself. If the first
+    line is longer than the block, the whole block is searched.
+    Results are cached until the file is modified.
+
     Args:
     file_path (str): Path to the CSV file.
     expected_separator (str): The expected separator character, e.g., ',', ';', or '\t'.
@@ -20,22 +56,52 @@ def is_valid_csv_separator(file_path: str, expected_separator: str) -> bool:
     bool: True if the expected separator is used, False otherwise.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            # Read the first line of the file
-            first_line = file.readline()
-
-            # Check if the expected separator is in the first line
-            if expected_separator in first_line:
-                # If the separator is found, return True indicating a valid
-                # separator.
-                return True
-            else:
-                return False
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_mtime_ns,
+               stat.st_size, expected_separator)
+        if key in _SEPARATOR_CACHE:
+            return _SEPARATOR_CACHE[key]
+
+        # Check if the expected separator is in the first line
+        is_valid = expected_separator.encode('utf-8') in _read_header(file_path)
+        _SEPARATOR_CACHE[key] = is_valid
+        return is_valid
     except IOError as e:
         # Log an error message if the file can't be opened
-        logging.error(f"Error opening file {file_path}: {e}")
+        logging.error("Error opening file %s: %s", file_path, e)
         return False
     except Exception as e:
         # Log any other unexpected errors
-        logging.error(f"Unexpected error: {e}")
+        logging.error("Unexpected error: %s", e)
         return False
+
+
+def detect_csv_separator(file_path: str) -> Optional[str]:
+    """
+    Guesses the separator of a CSV file from its header line.
+
+    Each candidate separator (',', ';', '\t' and '|') is counted in the raw
+    bytes of the first line. The most frequent one is returned if it appears
+    more often than any other; a tie, or a header with none of them, is too
+    ambiguous to decide on and gives None.
+
+    Args:
+    file_path (str): Path to the CSV file.
+
+    Returns:
+    str or None: The detected separator, or None if it could not be decided.
+    """
+    try:
+        header = _read_header(file_path)
+    except IOError as e:
+        # Log an error message if the file can't be opened
+        logging.error("Error opening file %s: %s", file_path, e)
+        return None
+
+    # Count every candidate, most frequent first
+    counts = sorted(((header.count(separator.encode('utf-8')), separator)
+                     for separator in _CANDIDATE_SEPARATORS), reverse=True)
+    (best_count, best_separator), (second_count, _) = counts[0], counts[1]
+    if best_count == 0 or best_count == second_count:
+        return None
+    return best_separator